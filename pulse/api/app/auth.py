@@ -10,9 +10,6 @@ fall back to the `X-User-Id` header so local development keeps working.
 """
 from __future__ import annotations
 
-import time
-
-import httpx
 import jwt
 from jwt import PyJWKClient
 from fastapi import Header, HTTPException
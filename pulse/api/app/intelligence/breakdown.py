@@ -5,9 +5,8 @@ import re
 from datetime import datetime
 
 from app.schemas import TaskDraft, Task, Subtask, CalendarEvent, AnalyzeResponse
-from app.intelligence.priority import compute_priority, ensure_aware
+from app.intelligence.priority import compute_priority
 from app.intelligence.risk import compute_risk
-from app.intelligence.scheduler import generate_schedule
 
 DIFFICULTY_MULT = {"easy": 1.1, "medium": 1.28, "hard": 1.55}
 
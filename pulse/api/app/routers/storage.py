@@ -6,9 +6,12 @@ The frontend posts multipart files here and gets back public URLs.
 """
 from __future__ import annotations
 
+import asyncio
+import io
 import re
+import secrets
 import time
-import uuid
+from typing import AsyncIterator
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 
@@ -19,6 +22,12 @@ router = APIRouter(prefix="/storage", tags=["storage"])
 
 BUCKET = "task-attachments"
 MAX_BYTES = 10 * 1024 * 1024  # 10 MB per file
+# Files are pushed to Storage concurrently; cap how many are in flight so a
+# large batch can't open an unbounded number of connections.
+MAX_CONCURRENT_UPLOADS = 4
+# Uploads are streamed to Storage straight from the spooled request file in
+# large reads, so only one chunk per file is ever held in memory.
+UPLOAD_CHUNK = 4 * 1024 * 1024
 ALLOWED_TYPES = {
     "application/pdf",
     "image/png",
@@ -32,6 +41,22 @@ def _safe_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9.\-_]", "_", name or "file")
 
 
+def _upload_size(f: UploadFile) -> int:
+    """Size of the spooled upload. Starlette records it while parsing; if it
+    is missing, measure the spooled file by seeking to its end."""
+    if f.size is not None:
+        return f.size
+    size = f.file.seek(0, io.SEEK_END)
+    f.file.seek(0)
+    return size
+
+
+async def _iter_chunks(f: UploadFile) -> AsyncIterator[bytes]:
+    await f.seek(0)
+    while chunk := await f.read(UPLOAD_CHUNK):
+        yield chunk
+
+
 @router.post("/task-attachments")
 async def upload_task_attachments(
     files: list[UploadFile] = File(...),
@@ -44,21 +69,33 @@ async def upload_task_attachments(
 
     # Namespace by the verified Clerk user id — clients cannot spoof this.
     prefix = _safe_name(user_id)
-    urls: list[str] = []
 
     for f in files:
         if f.content_type not in ALLOWED_TYPES:
             raise HTTPException(status_code=415, detail=f"Unsupported file type: {f.content_type}")
-        content = await f.read()
-        if len(content) > MAX_BYTES:
+        if _upload_size(f) > MAX_BYTES:
             raise HTTPException(status_code=413, detail=f"{f.filename} exceeds the 10 MB limit.")
 
-        # Namespaced, collision-resistant object key.
-        path = f"{prefix}/{int(time.time() * 1000)}-{uuid.uuid4().hex[:6]}-{_safe_name(f.filename or 'file')}"
-        try:
-            url = await db.upload_object(BUCKET, path, content, f.content_type)
-        except Exception as e:  # noqa: BLE001 — surface a clean error to the client
-            raise HTTPException(status_code=502, detail=f"Upload failed: {e}")
-        urls.append(url)
+    slots = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+    async def upload_one(f: UploadFile) -> str:
+        async with slots:
+            # Namespaced, collision-resistant object key.
+            path = f"{prefix}/{int(time.time() * 1000)}-{secrets.token_hex(3)}-{_safe_name(f.filename or 'file')}"
+            try:
+                return await db.upload_object(
+                    BUCKET, path, _iter_chunks(f), f.content_type, content_length=_upload_size(f)
+                )
+            except Exception as e:  # noqa: BLE001 — surface a clean error to the client
+                raise HTTPException(status_code=502, detail=f"Upload failed: {e}")
+
+    # A TaskGroup cancels the remaining uploads as soon as one fails, so none are
+    # left streaming from UploadFiles that close when the 502 is sent.
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(upload_one(f)) for f in files]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0]
 
-    return {"urls": urls}
+    # Tasks were created in submission order, so urls line up with the files.
+    return {"urls": [t.result() for t in tasks]}
@@ -5,7 +5,7 @@ Every method scopes by user_id. If Supabase isn't configured the client raises
 """
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterable
 import httpx
 
 from app.config import get_settings
@@ -59,15 +59,27 @@ class Supabase:
             r = await c.delete(f"{self._base}/{table}", headers=self._headers, params={"id": f"eq.{row_id}"})
             r.raise_for_status()
 
-    async def upload_object(self, bucket: str, path: str, content: bytes, content_type: str | None) -> str:
-        """Upload bytes to Storage with the service-role key (bypasses RLS) and
-        return the object's public URL."""
+    async def upload_object(
+        self,
+        bucket: str,
+        path: str,
+        content: bytes | AsyncIterable[bytes],
+        content_type: str | None,
+        content_length: int | None = None,
+    ) -> str:
+        """Upload bytes (or an async stream of chunks) to Storage with the
+        service-role key (bypasses RLS) and return the object's public URL.
+
+        Pass `content_length` with a stream so the body goes out with a
+        Content-Length instead of chunked transfer encoding."""
         headers = {
             "apikey": self._key,
             "Authorization": f"Bearer {self._key}",
             "Content-Type": content_type or "application/octet-stream",
             "x-upsert": "false",
         }
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
         async with httpx.AsyncClient(timeout=30) as c:
             r = await c.post(f"{self._storage}/object/{bucket}/{path}", headers=headers, content=content)
             r.raise_for_status()
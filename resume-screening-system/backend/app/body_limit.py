@@ -0,0 +1,79 @@
+"""Request body size limiting.
+
+FastAPI parses a multipart body (spooling file parts to a temp file) *before*
+the route runs, so a size check inside ``/analyze`` only fires after an
+oversized upload has already been received and written to disk. This ASGI
+middleware enforces a cap on the raw request body instead:
+
+    * a declared ``Content-Length`` above the cap is rejected with 413 before a
+      single body byte is read, and
+    * bodies without one (chunked transfer encoding) are counted as they stream
+      in and aborted with 413 as soon as the cap is crossed.
+
+Usage:
+    ``main.py`` calls :func:`install_body_limit` while building the app. It is
+    registered before CORS so 413 responses still carry CORS headers.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+
+def _too_large_detail(max_bytes: int) -> str:
+    limit_mb = max_bytes / (1024 * 1024)
+    return f"Request body exceeds the {limit_mb:.0f} MB limit."
+
+
+class BodySizeLimitMiddleware:
+    """Reject HTTP requests whose body is larger than ``max_bytes``."""
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope["headers"]).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+            response = JSONResponse(
+                status_code=413, content={"detail": _too_large_detail(self.max_bytes)}
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def capped_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # FastAPI re-raises HTTPException from body parsing, so this
+                    # surfaces as a normal JSON 413 via the exception middleware.
+                    raise HTTPException(
+                        status_code=413, detail=_too_large_detail(self.max_bytes)
+                    )
+            return message
+
+        await self.app(scope, capped_receive, send)
+
+
+def install_body_limit(app: "FastAPI", max_bytes: int | None = None) -> None:
+    """Register the body size limit (``MAX_REQUEST_BYTES`` by default) on the app."""
+    if max_bytes is None:
+        max_bytes = get_settings().MAX_REQUEST_BYTES
+    app.add_middleware(BodySizeLimitMiddleware, max_bytes=max_bytes)
@@ -12,12 +12,16 @@ from __future__ import annotations
 from functools import lru_cache
 from pathlib import Path
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # backend/.env — loaded automatically by pydantic-settings when present.
 _ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
 
+# Room above MAX_UPLOAD_BYTES in the default request body cap, covering
+# multipart framing and the job-description form field.
+_REQUEST_BODY_HEADROOM_BYTES = 1024 * 1024
+
 
 class Settings(BaseSettings):
     """Container for runtime configuration.
@@ -66,6 +70,12 @@ class Settings(BaseSettings):
     # Maximum accepted résumé upload size, in bytes (default 5 MB).
     MAX_UPLOAD_BYTES: int = 5 * 1024 * 1024
 
+    # Maximum raw request body size, in bytes. Enforced by middleware before the
+    # body is parsed, so oversized uploads are refused without being spooled to
+    # disk. Defaults to MAX_UPLOAD_BYTES plus 1 MB of headroom; an explicit value
+    # must be larger than MAX_UPLOAD_BYTES.
+    MAX_REQUEST_BYTES: int | None = None
+
     # Maximum characters of text (résumé or JD) fed to the NLP layer. Caps CPU
     # work and memory for pathological inputs; well above any real résumé/JD and
     # far beyond the embedding model's effective token window.
@@ -107,6 +117,24 @@ class Settings(BaseSettings):
             return [item.strip() for item in value.split(",") if item.strip()]
         return value
 
+    @model_validator(mode="after")
+    def _derive_request_cap(self) -> "Settings":
+        """Keep MAX_REQUEST_BYTES consistent with MAX_UPLOAD_BYTES.
+
+        Left unset, the cap follows the upload limit so raising
+        MAX_UPLOAD_BYTES alone never makes the middleware reject uploads the
+        route would accept. An explicit cap at or below the upload limit is a
+        misconfiguration and fails at load time.
+        """
+        if self.MAX_REQUEST_BYTES is None:
+            self.MAX_REQUEST_BYTES = self.MAX_UPLOAD_BYTES + _REQUEST_BODY_HEADROOM_BYTES
+        elif self.MAX_REQUEST_BYTES <= self.MAX_UPLOAD_BYTES:
+            raise ValueError(
+                "MAX_REQUEST_BYTES must be larger than MAX_UPLOAD_BYTES "
+                f"({self.MAX_REQUEST_BYTES} <= {self.MAX_UPLOAD_BYTES})."
+            )
+        return self
+
     @property
     def ai_enabled(self) -> bool:
         """True when an OpenRouter key is configured."""
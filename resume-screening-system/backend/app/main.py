@@ -1,7 +1,8 @@
 """FastAPI application entry point.
 
 Wires up the application:
-    * an app factory (``create_app``) that configures CORS and rate limiting,
+    * an app factory (``create_app``) that configures CORS, rate limiting and
+      the request body size limit,
     * a background model warmup on startup (via ``lifespan``) plus a manual
       ``GET /warmup`` endpoint,
     * a ``GET /health`` liveness probe, and
@@ -14,13 +15,16 @@ Run locally with::
 
 from __future__ import annotations
 
+import json
 import logging
 import threading
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.body_limit import install_body_limit
 from app.config import get_settings
 from app.rate_limit import install_rate_limiting
 from app.routes import router as analysis_router
@@ -60,11 +64,18 @@ def create_app() -> FastAPI:
         description="Upload a résumé and a job description to get a semantic "
         "match score and a list of missing skills.",
         lifespan=lifespan,
+        # orjson serialises response bodies in native code, noticeably faster
+        # than the stdlib json encoder for the larger /analyze payloads.
+        default_response_class=ORJSONResponse,
     )
 
     # Per-IP rate limiting (slowapi). No-op when RATE_LIMIT_ENABLED is false.
     install_rate_limiting(app)
 
+    # Refuse oversized request bodies before they are parsed/spooled. Added
+    # before CORS so the 413 still carries CORS headers for the browser.
+    install_body_limit(app)
+
     # Allow the React dev frontend to call the API from the browser.
     # The API is stateless and uses no cookies/credentials, so we keep
     # allow_credentials=False and scope methods/headers explicitly rather than
@@ -90,14 +101,20 @@ def create_app() -> FastAPI:
             "health": "/health",
         }
 
-    @app.get("/health", tags=["meta"])
-    def health() -> dict:
-        """Liveness probe used by tooling and the frontend."""
-        return {
+    # The health payload never changes for the life of the process, so it is
+    # serialised once here rather than on every probe.
+    health_body = json.dumps(
+        {
             "status": "ok",
             "service": "resume-screening",
             "version": settings.VERSION,
         }
+    ).encode()
+
+    @app.get("/health", tags=["meta"])
+    def health() -> Response:
+        """Liveness probe used by tooling and the frontend."""
+        return Response(content=health_body, media_type="application/json")
 
     @app.get("/warmup", tags=["meta"])
     async def warmup() -> dict:
@@ -3,7 +3,7 @@
 Exposes the core ``POST /analyze`` endpoint which accepts a résumé PDF or DOCX
 upload plus a job-description string, then orchestrates the service layer:
 
-    PDF/DOCX bytes ──> document_service ──> résumé text
+    PDF/DOCX upload ─> document_service ──> résumé text
                                                  │
     job description ─────────────────────────────┤
                                                  ▼
@@ -20,7 +20,20 @@ resolved against the wrong module globals, which makes FastAPI misread the retur
 type. Keeping concrete annotations avoids that.
 """
 
-from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile, status
+import asyncio
+import hashlib
+import io
+
+from fastapi import (
+    APIRouter,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 from fastapi.concurrency import run_in_threadpool
 
 from app.config import get_settings
@@ -39,7 +52,7 @@ from app.schemas import (
     Suggestions,
 )
 from app.services.chat_service import generate_chat_reply
-from app.services.document_service import extract_text_from_upload
+from app.services.document_service import extract_text_from_stream
 from app.services.llm_service import extract_skills_llm, generate_suggestions
 from app.services.nlp_service import compute_score_breakdown, compute_similarity
 from app.services.retrieval_service import retrieve_context
@@ -48,32 +61,35 @@ from app.services.skill_service import analyze_skills, extract_known_skills
 router = APIRouter(tags=["analysis"])
 settings = get_settings()
 
-# Read uploads in 1 MB chunks so we can abort early on oversized files.
-_READ_CHUNK = 1024 * 1024
+
+def _upload_size(upload: UploadFile) -> int:
+    """Return the size in bytes of an already-spooled upload.
+
+    Starlette records ``UploadFile.size`` while parsing the multipart body; when
+    it is missing we measure the spooled file by seeking to its end instead of
+    reading it.
+    """
+    if upload.size is not None:
+        return upload.size
+    stream = upload.file
+    size = stream.seek(0, io.SEEK_END)
+    stream.seek(0)
+    return size
 
 
-async def _read_upload_capped(upload: UploadFile, max_bytes: int) -> bytes:
-    """Read an upload into memory, aborting as soon as it exceeds ``max_bytes``.
+def _ensure_upload_within_limit(upload: UploadFile, max_bytes: int) -> None:
+    """Raise 413 if ``upload`` exceeds ``max_bytes``.
 
-    Reading in bounded chunks means a malicious/huge upload never gets fully
-    buffered — we stop and raise 413 once the cap is crossed. Peak memory is
-    bounded by ``max_bytes + _READ_CHUNK``.
+    The upload is never buffered into memory: Starlette has already spooled it
+    (rolling over to a temp file above 1 MB), and the extractors parse that
+    file object in place.
     """
-    chunks: list[bytes] = []
-    total = 0
-    while True:
-        chunk = await upload.read(_READ_CHUNK)
-        if not chunk:
-            break
-        total += len(chunk)
-        if total > max_bytes:
-            limit_mb = max_bytes / (1024 * 1024)
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"Résumé exceeds the {limit_mb:.0f} MB upload limit.",
-            )
-        chunks.append(chunk)
-    return b"".join(chunks)
+    if _upload_size(upload) > max_bytes:
+        limit_mb = max_bytes / (1024 * 1024)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Résumé exceeds the {limit_mb:.0f} MB upload limit.",
+        )
 
 
 @router.post(
@@ -115,13 +131,13 @@ async def analyze(
                 detail=f"Expected a PDF or DOCX upload, got '{resume.content_type}'.",
             )
 
-        # --- Read bytes with an enforced, streamed size cap ---
-        data = await _read_upload_capped(resume, settings.MAX_UPLOAD_BYTES)
+        # --- Enforce the size cap on the spooled upload ---
+        _ensure_upload_within_limit(resume, settings.MAX_UPLOAD_BYTES)
 
         # --- Extract text from the résumé (blocking → threadpool) ---
         try:
             resume_text = await run_in_threadpool(
-                extract_text_from_upload, data, resume.filename
+                extract_text_from_stream, resume.file, resume.filename
             )
         except PDFExtractionError as exc:
             raise HTTPException(
@@ -142,8 +158,10 @@ async def analyze(
         # --- Optional LLM skill extraction (best-effort; union with regex) ---
         if settings.ai_enabled and settings.LLM_SKILL_EXTRACTION:
             try:
-                llm_resume_aug = await extract_skills_llm(resume_text)
-                llm_jd_aug = await extract_skills_llm(jd)
+                # Independent network calls — run them concurrently.
+                llm_resume_aug, llm_jd_aug = await asyncio.gather(
+                    extract_skills_llm(resume_text), extract_skills_llm(jd)
+                )
                 if llm_resume_aug or llm_jd_aug:
                     resume_skills = extract_known_skills(resume_text)
                     jd_skills = extract_known_skills(jd)
@@ -328,14 +346,43 @@ _FREE_MODELS: list[dict] = [
 _DEFAULT_FREE_MODEL = "openai/gpt-4o-mini"
 
 
+# The model list is static for the life of the process: serialise it once and
+# let clients revalidate with its ETag instead of re-downloading it.
+_MODELS_BODY = (
+    ModelsResponse(
+        models=[ModelInfo(**m) for m in _FREE_MODELS],
+        default=_DEFAULT_FREE_MODEL,
+    )
+    .model_dump_json()
+    .encode()
+)
+_MODELS_ETAG = f'"{hashlib.blake2b(_MODELS_BODY, digest_size=8).hexdigest()}"'
+_MODELS_CACHE_HEADERS = {"ETag": _MODELS_ETAG, "Cache-Control": "public, max-age=3600"}
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header value matches ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get(
     "/models",
     response_model=ModelsResponse,
     summary="List available free-tier AI models",
 )
-def list_models() -> ModelsResponse:
-    """Return the curated list of free-tier models the frontend can offer."""
-    return ModelsResponse(
-        models=[ModelInfo(**m) for m in _FREE_MODELS],
-        default=_DEFAULT_FREE_MODEL,
+def list_models(request: Request) -> Response:
+    """Return the curated list of free-tier models the frontend can offer.
+
+    Responds ``304 Not Modified`` when the client already holds the current
+    list (``If-None-Match`` matches the ETag).
+    """
+    if _etag_matches(request.headers.get("if-none-match"), _MODELS_ETAG):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=_MODELS_CACHE_HEADERS
+        )
+    return Response(
+        content=_MODELS_BODY, media_type="application/json", headers=_MODELS_CACHE_HEADERS
     )
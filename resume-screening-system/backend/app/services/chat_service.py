@@ -9,7 +9,6 @@ specifically and grounded in retrieved résumé/JD excerpts (see
 
 from __future__ import annotations
 
-from app.config import get_settings
 from app.services.llm_service import _openrouter_chat
 
 # Keep at most this many of the most recent turns to bound token usage.
@@ -1,6 +1,7 @@
 """Résumé document text-extraction dispatch.
 
-Turns an uploaded résumé (raw bytes) into clean plain text regardless of format.
+Turns an uploaded résumé (raw bytes or a seekable binary file object) into clean
+plain text regardless of format.
 Supported formats:
 
 * **PDF**  – delegated to :mod:`app.services.pdf_service` (pdfminer.six).
@@ -17,12 +18,15 @@ from __future__ import annotations
 
 import io
 import logging
+import os
+from typing import BinaryIO
 
 from app.config import get_settings
 from app.exceptions import PDFExtractionError
 from app.services.pdf_service import (
+    _MAGIC_SCAN_BYTES,
     _normalise_whitespace,
-    extract_text_from_pdf_bytes,
+    extract_text_from_pdf_stream,
     looks_like_pdf,
 )
 
@@ -47,12 +51,30 @@ def extract_text_from_docx_bytes(data: bytes) -> str:
         The extracted, whitespace-normalised text (paragraphs plus table cells).
 
     Raises:
-        PDFExtractionError: If the bytes are empty, are not a valid DOCX, cannot
-            be parsed, or contain no extractable text.
+        PDFExtractionError: See :func:`extract_text_from_docx_stream`.
     """
-    if not data:
+    return extract_text_from_docx_stream(io.BytesIO(data))
+
+
+def extract_text_from_docx_stream(stream: BinaryIO) -> str:
+    """Extract normalised plain text from a seekable binary DOCX stream.
+
+    Args:
+        stream: A seekable binary file object; it is rewound before parsing.
+
+    Returns:
+        The extracted, whitespace-normalised text (paragraphs plus table cells).
+
+    Raises:
+        PDFExtractionError: If the stream is empty, is not a valid DOCX, cannot
+            be parsed, or contains no extractable text.
+    """
+    stream.seek(0)
+    head = stream.read(len(_ZIP_MAGIC))
+    stream.seek(0)
+    if not head:
         raise PDFExtractionError("Uploaded file is empty.")
-    if not looks_like_docx(data):
+    if not looks_like_docx(head):
         raise PDFExtractionError(
             "Uploaded file does not appear to be a valid DOCX."
         )
@@ -60,7 +82,7 @@ def extract_text_from_docx_bytes(data: bytes) -> str:
     try:
         from docx import Document
 
-        document = Document(io.BytesIO(data))
+        document = Document(stream)
     except Exception as exc:  # python-docx raises a variety of errors
         logger.warning("DOCX parse error: %s", exc)
         raise PDFExtractionError(
@@ -101,16 +123,41 @@ def extract_text_from_upload(data: bytes, filename: str | None = None) -> str:
     Raises:
         PDFExtractionError: If the format is unsupported or extraction fails.
     """
-    if not data:
+    return extract_text_from_stream(io.BytesIO(data), filename)
+
+
+def extract_text_from_stream(stream: BinaryIO, filename: str | None = None) -> str:
+    """Extract text from a seekable résumé stream, dispatching by content sniffing.
+
+    Only the leading bytes are read for sniffing; the chosen extractor then
+    parses the stream in place, so a spooled upload is never copied into memory
+    as a whole.
+
+    Args:
+        stream: A seekable binary file object (e.g. ``UploadFile.file``).
+        filename: Original filename (used only as a fallback hint).
+
+    Returns:
+        Extracted, normalised plain text.
+
+    Raises:
+        PDFExtractionError: If the format is unsupported or extraction fails.
+    """
+    stream.seek(0)
+    head = stream.read(_MAGIC_SCAN_BYTES)
+    stream.seek(0)
+    if not head:
         raise PDFExtractionError("Uploaded file is empty.")
 
-    if looks_like_pdf(data):
-        return extract_text_from_pdf_bytes(data)
-    if looks_like_docx(data):
-        return extract_text_from_docx_bytes(data)
+    if looks_like_pdf(head):
+        return extract_text_from_pdf_stream(stream)
+    if looks_like_docx(head):
+        return extract_text_from_docx_stream(stream)
 
     # Last-ditch: fall back on the filename extension for the error message.
-    ext = (filename or "").lower().rsplit(".", 1)[-1] if filename else ""
+    # splitext yields "" for a name with no dot (rsplit would return the whole
+    # name) and only the final suffix for e.g. "resume.pdf.png".
+    ext = os.path.splitext(filename or "")[1][1:].lower()
     raise PDFExtractionError(
         f"Unsupported résumé format ('{ext or 'unknown'}'). "
         "Please upload a PDF or DOCX file."
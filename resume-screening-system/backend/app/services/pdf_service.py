@@ -2,8 +2,8 @@
 
 Wraps :mod:`pdfminer.six` to turn an uploaded PDF (raw bytes) into clean,
 normalised plain text. The functions here are deliberately framework-agnostic:
-they accept ``bytes`` rather than a FastAPI ``UploadFile`` so they can be unit
-tested in isolation.
+they accept ``bytes`` or a seekable binary file object rather than a FastAPI
+``UploadFile`` so they can be unit tested in isolation.
 """
 
 from __future__ import annotations
@@ -11,6 +11,7 @@ from __future__ import annotations
 import io
 import logging
 import re
+from typing import BinaryIO
 
 from pdfminer.high_level import extract_text
 from pdfminer.pdfparser import PDFSyntaxError
@@ -24,6 +25,9 @@ logger = logging.getLogger(__name__)
 # cheap sanity check before handing bytes to the (heavier) parser.
 _PDF_MAGIC = b"%PDF-"
 
+# How many leading bytes ``looks_like_pdf`` scans for the signature.
+_MAGIC_SCAN_BYTES = 1024
+
 
 def _normalise_whitespace(text: str) -> str:
     """Collapse noisy PDF whitespace into clean, readable text.
@@ -50,7 +54,7 @@ def looks_like_pdf(data: bytes) -> bool:
     The signature may be preceded by a few junk bytes in rare real-world files,
     so we scan the first 1KB rather than requiring it at offset 0.
     """
-    return _PDF_MAGIC in data[:1024]
+    return _PDF_MAGIC in data[:_MAGIC_SCAN_BYTES]
 
 
 def extract_text_from_pdf_bytes(data: bytes) -> str:
@@ -63,20 +67,42 @@ def extract_text_from_pdf_bytes(data: bytes) -> str:
         The extracted, whitespace-normalised text.
 
     Raises:
-        PDFExtractionError: If the bytes are empty, are not a PDF, cannot be
-            parsed, or contain no extractable text (e.g. a scanned/image-only
+        PDFExtractionError: See :func:`extract_text_from_pdf_stream`.
+    """
+    return extract_text_from_pdf_stream(io.BytesIO(data))
+
+
+def extract_text_from_pdf_stream(stream: BinaryIO) -> str:
+    """Extract normalised plain text from a seekable binary PDF stream.
+
+    pdfminer reads the file object directly, so an upload spooled to disk is
+    parsed in place instead of first being copied into memory.
+
+    Args:
+        stream: A seekable binary file object positioned anywhere; it is
+            rewound before parsing.
+
+    Returns:
+        The extracted, whitespace-normalised text.
+
+    Raises:
+        PDFExtractionError: If the stream is empty, is not a PDF, cannot be
+            parsed, or contains no extractable text (e.g. a scanned/image-only
             PDF with no text layer).
     """
-    if not data:
+    stream.seek(0)
+    head = stream.read(_MAGIC_SCAN_BYTES)
+    stream.seek(0)
+    if not head:
         raise PDFExtractionError("Uploaded file is empty.")
 
-    if not looks_like_pdf(data):
+    if not looks_like_pdf(head):
         raise PDFExtractionError(
             "Uploaded file does not appear to be a valid PDF."
         )
 
     try:
-        raw_text = extract_text(io.BytesIO(data))
+        raw_text = extract_text(stream)
     except PDFSyntaxError as exc:  # malformed / corrupt PDF structure
         # Log the underlying detail server-side; return a generic message so we
         # don't leak library/stack internals to the client.
@@ -57,11 +57,62 @@ def test_analyze_non_pdf_returns_400(sample_jd):
     assert "pdf" in res.json()["detail"].lower()
 
 
+def test_analyze_oversized_upload_returns_413(monkeypatch, sample_resume_pdf, sample_jd):
+    import app.routes as routes
+
+    monkeypatch.setattr(routes.settings, "MAX_UPLOAD_BYTES", 64)
+    res = client.post(
+        "/analyze",
+        files={"resume": ("resume.pdf", sample_resume_pdf, "application/pdf")},
+        data={"job_description": sample_jd},
+    )
+    assert res.status_code == 413
+
+
 def test_analyze_missing_file_returns_422(sample_jd):
     res = client.post("/analyze", data={"job_description": sample_jd})
     assert res.status_code == 422
 
 
+# --- body size limit ---
+
+
+def _echo_app_with_body_limit(max_bytes: int) -> TestClient:
+    from fastapi import FastAPI, Request
+
+    from app.body_limit import install_body_limit
+
+    small = FastAPI()
+
+    @small.post("/echo")
+    async def echo(request: Request) -> dict:
+        return {"size": len(await request.body())}
+
+    install_body_limit(small, max_bytes=max_bytes)
+    return TestClient(small)
+
+
+def test_body_limit_rejects_declared_content_length():
+    res = _echo_app_with_body_limit(16).post("/echo", content=b"x" * 17)
+    assert res.status_code == 413
+
+
+def test_body_limit_rejects_oversized_chunked_body():
+    def chunks():
+        yield b"x" * 10
+        yield b"x" * 10
+
+    res = _echo_app_with_body_limit(16).post("/echo", content=chunks())
+    assert res.status_code == 413
+    assert "limit" in res.json()["detail"]
+
+
+def test_body_limit_allows_small_body():
+    res = _echo_app_with_body_limit(16).post("/echo", content=b"x" * 16)
+    assert res.status_code == 200
+    assert res.json()["size"] == 16
+
+
 # --- /suggest (AI suggestions) ---
 
 
@@ -205,3 +256,23 @@ def test_chat_happy_path_mocked(monkeypatch):
     assert "Kubernetes" in body["reply"]
     assert captured["missing"] == ["Kubernetes"]
     assert captured["messages"][-1]["content"] == "What skills am I missing?"
+
+
+# --- /models ---
+
+
+def test_models_lists_default_with_cache_headers():
+    res = client.get("/models")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["default"] in {m["id"] for m in body["models"]}
+    assert res.headers["etag"]
+    assert "max-age" in res.headers["cache-control"]
+
+
+def test_models_revalidation_returns_304():
+    etag = client.get("/models").headers["etag"]
+    res = client.get("/models", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert res.headers["etag"] == etag
@@ -5,6 +5,9 @@ CORS_ORIGINS legacy format still parses, and the ai_enabled property tracks the
 OpenRouter key.
 """
 
+import pytest
+from pydantic import ValidationError
+
 from app.config import Settings
 
 
@@ -13,6 +16,7 @@ def test_defaults_load():
     assert s.APP_NAME
     assert s.VERSION == "0.1.0"
     assert s.MAX_UPLOAD_BYTES > 0
+    assert s.MAX_REQUEST_BYTES > s.MAX_UPLOAD_BYTES
     assert s.MAX_TEXT_CHARS > 0
     # New rate-limit + LLM toggles have sane defaults.
     assert s.RATE_LIMIT_ENABLED is True
@@ -48,3 +52,21 @@ def test_env_override_applies(monkeypatch):
     s = Settings()
     assert s.RATE_LIMIT_ENABLED is False
     assert s.MAX_TEXT_CHARS == 1234
+
+
+def test_request_cap_follows_upload_limit_override(monkeypatch):
+    monkeypatch.setenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024))
+    s = Settings(_env_file=None)
+    assert s.MAX_REQUEST_BYTES == 11 * 1024 * 1024
+
+
+def test_request_cap_explicit_override_applies(monkeypatch):
+    monkeypatch.setenv("MAX_REQUEST_BYTES", str(8 * 1024 * 1024))
+    assert Settings(_env_file=None).MAX_REQUEST_BYTES == 8 * 1024 * 1024
+
+
+def test_request_cap_not_above_upload_limit_is_rejected(monkeypatch):
+    monkeypatch.setenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024))
+    monkeypatch.setenv("MAX_REQUEST_BYTES", str(6 * 1024 * 1024))
+    with pytest.raises(ValidationError, match="MAX_REQUEST_BYTES"):
+        Settings(_env_file=None)
@@ -11,6 +11,7 @@ import pytest
 from app.exceptions import PDFExtractionError
 from app.services.document_service import (
     extract_text_from_docx_bytes,
+    extract_text_from_stream,
     extract_text_from_upload,
     looks_like_docx,
 )
@@ -89,3 +90,24 @@ def test_upload_dispatch_docx():
 def test_upload_unsupported_format_raises():
     with pytest.raises(PDFExtractionError):
         extract_text_from_upload(b"\x89PNG\r\n\x1a\n plain image bytes", "img.png")
+
+
+def test_upload_unsupported_format_reports_extension():
+    with pytest.raises(PDFExtractionError, match=r"\('png'\)"):
+        extract_text_from_upload(b"\x89PNG\r\n\x1a\n", "scan.final.png")
+    with pytest.raises(PDFExtractionError, match=r"\('unknown'\)"):
+        extract_text_from_upload(b"\x89PNG\r\n\x1a\n", "resume")
+
+
+def test_stream_dispatch_parses_spooled_file(sample_resume_pdf):
+    import tempfile
+
+    with tempfile.SpooledTemporaryFile(max_size=16) as spooled:
+        spooled.write(sample_resume_pdf)  # exceeds max_size -> rolled to disk
+        text = extract_text_from_stream(spooled, "resume.pdf")
+    assert "FastAPI" in text
+
+
+def test_stream_dispatch_empty_raises():
+    with pytest.raises(PDFExtractionError):
+        extract_text_from_stream(io.BytesIO(b""), "resume.pdf")